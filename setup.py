@@ -58,6 +58,8 @@ extras_require = {
         "black",
         "pre-commit",
         "pylint==2.4.4",
+        "orjson",
+        "pyarrow",
         "pytest==7.1.2",
         "pytest-xdist==3.1.0",
         "twine>=5",
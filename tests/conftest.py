@@ -1,3 +1,5 @@
+import os
+
 import pytest
 import time
 
@@ -30,6 +32,16 @@ def pytest_configure(config):
     if markexprs:
         setattr(config.option, "markexpr", " and ".join(markexprs))
 
+    # When running under pytest-xdist, give each worker its own adhoc
+    # datasource directory so workers don't clobber each other's SQLite files.
+    worker = os.environ.get("PYTEST_XDIST_WORKER", None)
+    if worker:
+        adhoc_dir = os.path.join(
+            zillion_config["ADHOC_DATASOURCE_DIRECTORY"], worker
+        )
+        os.makedirs(adhoc_dir, exist_ok=True)
+        zillion_config["ADHOC_DATASOURCE_DIRECTORY"] = adhoc_dir
+
 
 @pytest.fixture(scope="session")
 def mysql_setup():
@@ -84,8 +96,7 @@ def config():
 
 @pytest.fixture(scope="function")
 def ds_config():
-    config = copy.deepcopy(TEST_WH_CONFIG)
-    return config["datasources"]["testdb1"]
+    return copy.deepcopy(TEST_WH_CONFIG["datasources"]["testdb1"])
 
 
 @pytest.fixture(scope="function")
@@ -98,6 +109,14 @@ def wh(config):
     return Warehouse(config=config)
 
 
+@pytest.fixture(scope="module")
+def shared_wh():
+    """A shared warehouse for tests that do not mutate warehouse state. This
+    avoids rebuilding the warehouse (reflection, graph construction, etc.) for
+    every parameterized case."""
+    return Warehouse(config=copy.deepcopy(TEST_WH_CONFIG))
+
+
 @pytest.fixture(scope="function")
 def saved_wh():
     name = "test_warehouse_%s" % time.time()
@@ -116,11 +135,67 @@ def adhoc_ds(config):
     return get_adhoc_datasource()
 
 
-@pytest.fixture(scope="function")
-def mysql_ds_config(mysql_setup):
+@pytest.fixture(scope="session")
+def dma_zip_ds():
+    """Materialize every dma_zip file format into a single adhoc SQLite DB
+    once per session. Each format still goes through its own datatable parser,
+    but the parse/load cost is paid once instead of per test."""
+    primary_key = ["Zip_Code"]
+    datatables = [
+        CSVDataTable(
+            "dma_zip_csv",
+            "dma_zip.csv",
+            TableTypes.DIMENSION,
+            primary_key=primary_key,
+            columns=dict(
+                Zip_Code={"fields": ["Zip_Code"]}, DMA_Code={"fields": ["DMA_Code"]}
+            ),
+            if_exists=IfExistsModes.REPLACE,
+            schema="main",
+        ),
+        ExcelDataTable(
+            "dma_zip_xlsx",
+            "dma_zip.xlsx",
+            TableTypes.DIMENSION,
+            primary_key=primary_key,
+            columns=dict(
+                Zip_Code={"fields": ["Zip_Code"]}, DMA_Code={"fields": ["DMA_Code"]}
+            ),
+            if_exists=IfExistsModes.REPLACE,
+            schema="main",
+        ),
+        JSONDataTable(
+            "dma_zip_json",
+            "dma_zip.json",
+            TableTypes.DIMENSION,
+            primary_key=primary_key,
+            if_exists=IfExistsModes.REPLACE,
+            schema="main",
+            use_full_column_names=True,
+        ),
+        HTMLDataTable(
+            "dma_zip_html",
+            "dma_zip.html",
+            TableTypes.DIMENSION,
+            primary_key=primary_key,
+            if_exists=IfExistsModes.REPLACE,
+            schema="main",
+            use_full_column_names=True,
+        ),
+    ]
+    return DataSource.from_datatables("dma_zip_ds", datatables)
+
+
+@pytest.fixture(scope="session")
+def _mysql_raw_ds_config(mysql_setup):
     return load_datasource_config("test_mysql_ds_config.json")
 
 
+@pytest.fixture(scope="function")
+def mysql_ds_config(_mysql_raw_ds_config):
+    return copy.deepcopy(_mysql_raw_ds_config)
+
+
 @pytest.fixture(scope="function")
 def mysql_ds(mysql_ds_config):
     return DataSource("mysql", config=mysql_ds_config)
@@ -131,11 +206,16 @@ def mysql_wh(mysql_ds):
     return Warehouse(datasources=[mysql_ds])
 
 
-@pytest.fixture(scope="function")
-def postgresql_ds_config(postgresql_setup):
+@pytest.fixture(scope="session")
+def _postgresql_raw_ds_config(postgresql_setup):
     return load_datasource_config("test_postgresql_ds_config.json")
 
 
+@pytest.fixture(scope="function")
+def postgresql_ds_config(_postgresql_raw_ds_config):
+    return copy.deepcopy(_postgresql_raw_ds_config)
+
+
 @pytest.fixture(scope="function")
 def postgresql_ds(postgresql_ds_config):
     return DataSource("postgresql", config=postgresql_ds_config)
@@ -146,10 +226,14 @@ def postgresql_wh(postgresql_ds):
     return Warehouse(datasources=[postgresql_ds])
 
 
+@pytest.fixture(scope="session")
+def _duckdb_raw_wh_config():
+    return load_warehouse_config("test_duckdb_wh_config.json")
+
+
 @pytest.fixture(scope="function")
-def duckdb_wh():
-    config = load_warehouse_config("test_duckdb_wh_config.json")
-    return Warehouse(config=config)
+def duckdb_wh(_duckdb_raw_wh_config):
+    return Warehouse(config=copy.deepcopy(_duckdb_raw_wh_config))
 
 
 @pytest.fixture
@@ -1,4 +1,3 @@
-from collections import OrderedDict
 import os
 import pytest
 import time
@@ -549,37 +548,38 @@ def test_create_fields_has_columns(config):
     assert wh.has_dimension("main_partners_created_at")
 
 
-def test_get_dimension_table_set(wh):
-    possible = [{"partner_id", "partner_name"}, {"campaign_name", "partner_name"}]
-
-    impossible = [
-        {"lead_id", "partner_id"},
-        {"sale_id", "lead_id", "campaign_name", "partner_name"},
-    ]
-
-    for grain in possible:
-        ts = wh.get_dimension_table_set(grain, grain)
-
-    for grain in impossible:
+@pytest.mark.parametrize(
+    "grain,supported",
+    [
+        ({"partner_id", "partner_name"}, True),
+        ({"campaign_name", "partner_name"}, True),
+        ({"lead_id", "partner_id"}, False),
+        ({"sale_id", "lead_id", "campaign_name", "partner_name"}, False),
+    ],
+)
+def test_get_dimension_table_set(shared_wh, grain, supported):
+    if supported:
+        shared_wh.get_dimension_table_set(grain, grain)
+    else:
         with pytest.raises(UnsupportedGrainException):
-            ts = wh.get_dimension_table_set(grain, grain)
-
-
-def test_get_metric_table_set(wh):
-    possible = [
-        ("leads", {"partner_id", "partner_name"}),
-        ("leads", {"campaign_name", "partner_name"}),
-        ("revenue", {"campaign_name", "partner_name", "lead_id"}),
-    ]
-
-    impossible = [("leads", {"sale_id"})]
-
-    for metric, grain in possible:
-        wh.get_metric_table_set(metric, grain, grain)
-
-    for metric, grain in impossible:
+            shared_wh.get_dimension_table_set(grain, grain)
+
+
+@pytest.mark.parametrize(
+    "metric,grain,supported",
+    [
+        ("leads", {"partner_id", "partner_name"}, True),
+        ("leads", {"campaign_name", "partner_name"}, True),
+        ("revenue", {"campaign_name", "partner_name", "lead_id"}, True),
+        ("leads", {"sale_id"}, False),
+    ],
+)
+def test_get_metric_table_set(shared_wh, metric, grain, supported):
+    if supported:
+        shared_wh.get_metric_table_set(metric, grain, grain)
+    else:
         with pytest.raises(UnsupportedGrainException):
-            wh.get_metric_table_set(metric, grain, grain)
+            shared_wh.get_metric_table_set(metric, grain, grain)
 
 
 def test_get_supported_dimensions(wh):
@@ -673,7 +673,7 @@ def test_adhoc_datatable_has_columns():
     name = "adhoc_table1"
     primary_key = ["partner_name"]
 
-    columns = OrderedDict(partner_name={"fields": ["partner_name"]})
+    columns = dict(partner_name={"fields": ["partner_name"]})
 
     dt = AdHocDataTable(
         name,
@@ -690,84 +690,20 @@ def test_adhoc_datatable_has_columns():
     assert not ds.has_metric("adhoc_metric")
 
 
-def test_csv_datatable():
-    name = "dma_zip"
-    file_name = "dma_zip.csv"
-    primary_key = ["Zip_Code"]
-
-    columns = OrderedDict(
-        Zip_Code={"fields": ["Zip_Code"]}, DMA_Code={"fields": ["DMA_Code"]}
-    )
-
-    dt = CSVDataTable(
-        name,
-        file_name,
-        TableTypes.DIMENSION,
-        primary_key=primary_key,
-        columns=columns,
-        if_exists=IfExistsModes.REPLACE,
-        schema="main",
-    )
-    ds = DataSource.from_datatables("adhoc_ds", [dt])
-    ds.print_info()
-    assert "Zip_Code" in ds.get_dimensions()
-
-
-def test_excel_datatable():
-    name = "dma_zip"
-    file_name = "dma_zip.xlsx"
-    primary_key = ["Zip_Code"]
+def test_csv_datatable(dma_zip_ds):
+    dma_zip_ds.print_info()
+    assert "Zip_Code" in dma_zip_ds.get_dimensions()
 
-    columns = OrderedDict(
-        Zip_Code={"fields": ["Zip_Code"]}, DMA_Code={"fields": ["DMA_Code"]}
-    )
 
-    dt = ExcelDataTable(
-        name,
-        file_name,
-        TableTypes.DIMENSION,
-        primary_key=primary_key,
-        columns=columns,
-        if_exists=IfExistsModes.REPLACE,
-        schema="main",
-    )
-    ds = DataSource.from_datatables("adhoc_ds", [dt])
-    dims = ds.get_dimensions()
+def test_excel_datatable(dma_zip_ds):
+    dims = dma_zip_ds.get_dimensions()
     assert "Zip_Code" in dims
     assert "DMA_Description" not in dims
 
 
-def test_json_datatable():
-    name = "dma_zip"
-    file_name = "dma_zip.json"
-    primary_key = ["Zip_Code"]
-
-    dt = JSONDataTable(
-        name,
-        file_name,
-        TableTypes.DIMENSION,
-        primary_key=primary_key,
-        if_exists=IfExistsModes.REPLACE,
-        schema="main",
-        use_full_column_names=True,
-    )
-    ds = DataSource.from_datatables("adhoc_ds", [dt])
-    assert "main_dma_zip_Zip_Code" in ds.get_dimensions()
+def test_json_datatable(dma_zip_ds):
+    assert "main_dma_zip_json_Zip_Code" in dma_zip_ds.get_dimensions()
 
 
-def test_html_datatable():
-    name = "dma_zip"
-    file_name = "dma_zip.html"
-    primary_key = ["Zip_Code"]
-
-    dt = HTMLDataTable(
-        name,
-        file_name,
-        TableTypes.DIMENSION,
-        primary_key=primary_key,
-        if_exists=IfExistsModes.REPLACE,
-        schema="main",
-        use_full_column_names=True,
-    )
-    ds = DataSource.from_datatables("adhoc_ds", [dt])
-    assert "main_dma_zip_Zip_Code" in ds.get_dimensions()
+def test_html_datatable(dma_zip_ds):
+    assert "main_dma_zip_html_Zip_Code" in dma_zip_ds.get_dimensions()
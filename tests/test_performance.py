@@ -44,7 +44,7 @@ def get_adhoc_ds(size):
         "type": TableTypes.METRIC,
         "if_exists": IfExistsModes.REPLACE,
         "create_fields": True,
-        "columns": OrderedDict(
+        "columns": dict(
             partner_name={"fields": ["partner_name"]},
             campaign_name={"fields": ["campaign_name"]},
             lead_id={"fields": ["lead_id"]},
@@ -7,17 +7,17 @@ psql -h 127.0.0.1 -U postgres zillion_test < zillion_test.postgres.sql
 rm /tmp/adhoc_large_db.db (if it exists)
 """
 
-from collections import OrderedDict
 from contextlib import contextmanager
 import copy
 import logging
 import os
-import random
 import sys
 from shutil import copyfile
 
+import numpy as np
+import pandas as pd
 import pymysql
-from tlbx import st, random_string, shell
+from tlbx import st, shell
 import sqlalchemy as sa
 
 from zillion.configs import (
@@ -30,6 +30,10 @@ from zillion.core import *
 from zillion.datasource import (
     DataSource,
     AdHocDataTable,
+    CSVDataTable,
+    ExcelDataTable,
+    JSONDataTable,
+    HTMLDataTable,
     SQLiteDataTable,
     get_adhoc_datasource_filename,
     get_adhoc_datasource_url,
@@ -66,6 +70,18 @@ def update_zillion_config(updates):
         zillion_config.update(old)
 
 
+# SQLAlchemy engines cached per connection string. Engine creation parses the
+# URL and sets up a fresh pool each time, so tests share one engine per DB.
+ENGINE_CACHE = {}
+
+
+def get_cached_engine(conn_str):
+    """Get or create a cached SQLAlchemy engine for this connection string"""
+    if conn_str not in ENGINE_CACHE:
+        ENGINE_CACHE[conn_str] = sa.create_engine(conn_str)
+    return ENGINE_CACHE[conn_str]
+
+
 def mysql_data_init():
     host = test_config["MySQLHost"]
     port = int(test_config["MySQLPort"])
@@ -126,7 +142,7 @@ def get_sqlalchemy_mysql_engine():
             "mysql+pymysql://%(user)s:%(password)s@%(host)s:%(port)s/%(schema)s"
             % locals()
         )
-    engine = sa.create_engine(conn_str)
+    engine = get_cached_engine(conn_str)
     return engine
 
 
@@ -141,7 +157,7 @@ def get_sqlalchemy_postgresql_engine():
     user = test_config["PostgreSQLUser"]
     schema = test_config["PostgreSQLTestSchema"]
     conn_str = "postgresql+psycopg2://%(user)s@%(host)s:%(port)s/%(schema)s" % locals()
-    engine = sa.create_engine(conn_str)
+    engine = get_cached_engine(conn_str)
     return engine
 
 
@@ -153,7 +169,7 @@ def get_sqlalchemy_postgresql_conn():
 def get_sqlalchemy_duckdb_engine():
     schema = test_config["DuckDBTestSchema"]
     conn_str = f"duckdb:///{schema}"
-    engine = sa.create_engine(conn_str)
+    engine = get_cached_engine(conn_str)
     return engine
 
 
@@ -173,10 +189,27 @@ def get_sql(sql):
         conn.close()
 
 
+# Cache of reflected MetaData per connection URL. Reflection issues a query
+# per table, so we only pay that cost once per DB and hand out copies.
+REFLECTED_METADATA_CACHE = {}
+
+
+def reflect_test_metadata(connect_url):
+    """Reflect a test DB once per URL and return a fresh bound deep copy"""
+    if connect_url not in REFLECTED_METADATA_CACHE:
+        metadata = sa.MetaData()
+        metadata.bind = get_cached_engine(connect_url)
+        metadata.reflect(schema="main")
+        REFLECTED_METADATA_CACHE[connect_url] = metadata
+
+    # The bind is dropped on copy, so we reattach an engine
+    metadata = copy.deepcopy(REFLECTED_METADATA_CACHE[connect_url])
+    metadata.bind = get_cached_engine(connect_url)
+    return metadata
+
+
 def create_test_metadata(ds_config):
-    metadata = sa.MetaData()
-    metadata.bind = sa.create_engine(ds_config["connect"])
-    metadata.reflect(schema="main")
+    metadata = reflect_test_metadata(ds_config["connect"])
 
     # Create zillion info directly on metadata
     partners_info = TableInfo.create(
@@ -200,25 +233,26 @@ def drop_metadata_table_if_exists(metadata, table_name):
 
 
 def create_adhoc_data(column_types, size):
-    data = []
+    size = int(size)
 
-    def get_random_value(coltype):
+    def get_column_values(column_name, coltype):
         if coltype == str:
-            return random_string()
+            # Unique values, which also keeps primary keys collision-free
+            return np.char.add("%s_" % column_name, np.arange(size).astype(str))
         elif coltype == int:
-            return random.randint(0, 1e2)
+            return np.random.randint(0, int(1e2), size)
         elif coltype == float:
-            return random.random() * 1e2
+            return np.random.random(size) * 1e2
         else:
             assert False, "Unsupported column type: %s" % coltype
 
-    for i in range(0, int(size)):
-        row = dict()
-        for column_name, column_type in column_types.items():
-            row[column_name] = get_random_value(column_type)
-        data.append(row)
-
-    return data
+    columns = {
+        column_name: get_column_values(column_name, column_type)
+        for column_name, column_type in column_types.items()
+    }
+    # Return the DataFrame directly; AdHocDataTable accepts it as-is, so
+    # there is no need to round-trip through per-row record dicts.
+    return pd.DataFrame(columns)
 
 
 def create_adhoc_datatable(name, table_config, primary_key, column_types, size):
@@ -245,7 +279,7 @@ def get_adhoc_table_config():
         "type": TableTypes.METRIC,
         "if_exists": IfExistsModes.REPLACE,
         "create_fields": False,
-        "columns": OrderedDict(
+        "columns": dict(
             partner_name={"fields": ["partner_name"]},
             adhoc_metric={"fields": ["adhoc_metric"]},
         ),
@@ -257,7 +291,7 @@ def get_dma_zip_table_config():
     table_config = {
         "type": TableTypes.DIMENSION,
         "create_fields": True,
-        "columns": OrderedDict(
+        "columns": dict(
             Zip_Code={"fields": ["zip_code"]},
             DMA_Code={"fields": ["dma_code"]},
             DMA_Description={"fields": ["dma_description"]},
@@ -1,4 +1,6 @@
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
+import copy
+import hashlib
 import os
 import string
 
@@ -44,6 +46,31 @@ DATASOURCE_NAME_ALLOWED_CHARS = set(DATASOURCE_NAME_ALLOWED_CHARS_STR)
 DATASOURCE_CONNECT_FUNC_DEFAULT = "zillion.datasource.url_connect"
 
 
+# Parsed schema file results keyed by (schema class, content hash). Repeat
+# loads of identical config contents skip parsing and schema validation.
+# Configs that resolve external refs (includes, string datasource or table
+# refs) are never cached, since the content hash only covers the top-level
+# file. The cache is bounded; the oldest entry is evicted first.
+PARSED_SCHEMA_CACHE = {}
+PARSED_SCHEMA_CACHE_SIZE = 32
+
+
+def config_has_external_refs(data):
+    """Check whether a config dict pulls in other files or URLs, such as
+    includes, string datasource refs, or string table refs"""
+    if not isinstance(data, dict):
+        return False
+    if data.get("includes", None):
+        return True
+    for ds_config in (data.get("datasources", None) or {}).values():
+        if isinstance(ds_config, str):
+            return True
+    for table_config in (data.get("tables", None) or {}).values():
+        if isinstance(table_config, str):
+            return True
+    return False
+
+
 def parse_schema_file(f, schema):
     """Parse a marshmallow schema file
 
@@ -60,12 +87,25 @@ def parse_schema_file(f, schema):
 
     """
     raw = read_filepath_or_buffer(f)
+    raw_bytes = raw.encode("utf-8") if isinstance(raw, str) else raw
+    cache_key = (type(schema).__name__, hashlib.blake2b(raw_bytes).digest())
+    if cache_key in PARSED_SCHEMA_CACHE:
+        # Deep copy so callers are free to mutate the result
+        return copy.deepcopy(PARSED_SCHEMA_CACHE[cache_key])
+
     try:
-        result = load_json_or_yaml_from_str(raw, f, schema=schema)
+        data = load_json_or_yaml_from_str(raw, f)
+        cacheable = not config_has_external_refs(data)
+        result = schema.load(data)
     except ValidationError as e:
         error("Schema Validation Error: %s" % schema)
         print(json.dumps(str(e), indent=2))
         raise
+
+    if cacheable:
+        if len(PARSED_SCHEMA_CACHE) >= PARSED_SCHEMA_CACHE_SIZE:
+            PARSED_SCHEMA_CACHE.pop(next(iter(PARSED_SCHEMA_CACHE)))
+        PARSED_SCHEMA_CACHE[cache_key] = copy.deepcopy(result)
     return result
 
 
@@ -1289,7 +1329,7 @@ class ColumnInfo(ZillionInfo, PrintMixin):
 
     def __init__(self, **kwargs):
         super(ColumnInfo, self).__init__(**kwargs)
-        self._field_map = OrderedDict()
+        self._field_map = dict()
         for field in self.fields:
             self._add_field_to_map(field)
 
@@ -47,6 +47,22 @@ from tlbx import (
 )
 import yaml
 
+try:
+    # orjson parses several times faster than the stdlib; fall back quietly
+    import orjson
+
+    def json_loads(string):
+        # orjson is stricter than the stdlib (no NaN/Infinity literals,
+        # 64-bit int limit), so retry with stdlib json on failure to keep
+        # it purely a fast path.
+        try:
+            return orjson.loads(string)
+        except Exception:
+            return json.loads(string)
+
+except ImportError:
+    json_loads = json.loads
+
 # Last unicode char - this helps get the rollup rows to sort last, but may
 # need to be replaced for presentation.
 ROLLUP_INDEX_LABEL = chr(1114111)
@@ -360,12 +376,12 @@ def load_json_or_yaml_from_str(string, f=None, schema=None):
         if f.endswith("yaml") or f.endswith("yml"):
             load_result = yaml.safe_load(string)
         elif f.endswith("json"):
-            load_result = json.loads(string)
+            load_result = json_loads(string)
 
     if load_result is None:
         # f is not a filename, we try json and then fall back to yaml
         try:
-            load_result = json.loads(string)
+            load_result = json_loads(string)
         except Exception as ej:
             try:
                 load_result = yaml.safe_load(string)
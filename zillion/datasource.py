@@ -10,6 +10,15 @@ import networkx as nx
 from ordered_set import OrderedSet
 import sqlalchemy as sa
 
+pyarrow_installed = False
+
+try:
+    from pyarrow import csv as pyarrow_csv
+
+    pyarrow_installed = True
+except ImportError:
+    pass
+
 from zillion.configs import (
     load_datasource_config,
     DATASOURCE_NAME_ALLOWED_CHARS,
@@ -161,6 +170,7 @@ def data_url_to_metadata(
         pool_pre_ping=True,
         **get_engine_extra_kwargs(connect_url),
     )
+    tune_sqlite_engine(engine)
     metadata = sa.MetaData()
     metadata.bind = engine
     return metadata
@@ -191,7 +201,9 @@ def metadata_from_connect(connect, ds_name):
 
 def reflect_metadata(metadata, reflect_only=None):
     """Reflect the metadata object from the connection. If reflect_only is
-    passed, reflect only the tables specified in that list"""
+    passed, reflect only the tables specified in that list. Names in
+    reflect_only that do not exist in the database are silently skipped,
+    matching the behavior of full reflection for unmatched config tables."""
 
     raiseifnot(metadata.is_bound(), "MetaData must be bound to an engine")
     only_schema_tables = defaultdict(list)
@@ -213,6 +225,11 @@ def reflect_metadata(metadata, reflect_only=None):
         only = only_schema_tables.get(schema, []) or []
         if only_tables:
             only.extend(only_tables)
+        if only:
+            # Use a predicate rather than a list so names that don't exist
+            # in the database are skipped instead of raising.
+            only_set = set(only)
+            only = lambda table_name, metadata: table_name in only_set
         metadata.reflect(schema=schema, views=True, only=only or None)
 
 
@@ -227,6 +244,54 @@ def get_adhoc_datasource_url(ds_name):
     return "sqlite:///%s" % get_adhoc_datasource_filename(ds_name)
 
 
+def tune_sqlite_engine(engine):
+    """Apply SQLite pragmas that speed up bulk loads. This disables journal
+    and sync durability guarantees, so it should only be used for databases
+    that can be recreated from their source data, such as adhoc datasource
+    files."""
+    if engine.dialect.name != "sqlite":
+        return
+
+    @sa.event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, conn_record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+# Engines for adhoc datasources, cached per connection URL. Adhoc datasources
+# of the same name share a SQLite file, so the engine (and its pool/pragma
+# setup) can be reused across instances instead of recreated each time. The
+# cache is a bounded LRU: auto-generated datasource names produce a unique
+# URL per call, so without eviction each one would permanently leak an
+# engine and its pooled file handles. Evicted engines are disposed to
+# release their connections.
+ADHOC_DS_ENGINE_CACHE = {}
+ADHOC_DS_ENGINE_CACHE_SIZE = 25
+
+
+def get_adhoc_datasource_engine(ds_name):
+    """Get a cached SQLAlchemy engine for an adhoc datasource"""
+    conn_url = get_adhoc_datasource_url(ds_name)
+    engine = ADHOC_DS_ENGINE_CACHE.pop(conn_url, None)
+    if engine is None:
+        engine = sa.create_engine(
+            conn_url,
+            echo=False,
+            pool_pre_ping=True,
+            **get_engine_extra_kwargs(conn_url),
+        )
+        tune_sqlite_engine(engine)
+    # Reinsert so this URL is most-recently-used
+    ADHOC_DS_ENGINE_CACHE[conn_url] = engine
+    while len(ADHOC_DS_ENGINE_CACHE) > ADHOC_DS_ENGINE_CACHE_SIZE:
+        oldest_url = next(iter(ADHOC_DS_ENGINE_CACHE))
+        ADHOC_DS_ENGINE_CACHE.pop(oldest_url).dispose()
+    return engine
+
+
 def url_connect(
     ds_name,
     connect_url=None,
@@ -546,23 +611,26 @@ class DataSource(FieldManagerMixin, PrintMixin):
 
         self.apply_config(config, reflect=reflect, nlp=nlp)
 
-    @property
-    def metric_tables(self):
-        """A mapping of metric table names to table objects"""
+    def _get_tables_of_type(self, table_type):
+        """Single-pass scan for active tables of the given type. Note: this is
+        recomputed on each access rather than memoized because table zillion
+        info is mutable on the live metadata and there is no hook to invalidate
+        a cache when it changes."""
         return {
             table_name: table
             for table_name, table in self.metadata.tables.items()
-            if is_active(table) and table.zillion.type == TableTypes.METRIC
+            if is_active(table) and table.zillion.type == table_type
         }
 
+    @property
+    def metric_tables(self):
+        """A mapping of metric table names to table objects"""
+        return self._get_tables_of_type(TableTypes.METRIC)
+
     @property
     def dimension_tables(self):
-        """A dimension of metric table names to table objects"""
-        return {
-            table_name: table
-            for table_name, table in self.metadata.tables.items()
-            if is_active(table) and table.zillion.type == TableTypes.DIMENSION
-        }
+        """A mapping of dimension table names to table objects"""
+        return self._get_tables_of_type(TableTypes.DIMENSION)
 
     def has_table(self, table, check_active=True):
         """Check whether the table is in this datasource's metadata
@@ -676,6 +744,11 @@ class DataSource(FieldManagerMixin, PrintMixin):
             reflect_only = adhoc_tables
 
         if reflect:
+            if reflect_only is None and config.get("tables", None):
+                # Tables the config doesn't reference would end up with no
+                # zillion info and be inactive, so skip reflecting them. Full
+                # reflection still happens for configs with no table configs.
+                reflect_only = list(config["tables"].keys())
             reflect_metadata(self.metadata, reflect_only=reflect_only)
 
         if config.get("tables", None):
@@ -1568,13 +1641,7 @@ class DataSource(FieldManagerMixin, PrintMixin):
             del config["connect"]  # will pass metadata directly
         else:
             # No connection URL specified, let's create an adhoc SQLite DB
-            conn_url = get_adhoc_datasource_url(ds_name)
-            engine = sa.create_engine(
-                conn_url,
-                echo=False,
-                pool_pre_ping=True,
-                **get_engine_extra_kwargs(conn_url),
-            )
+            engine = get_adhoc_datasource_engine(ds_name)
             metadata = sa.MetaData()
             metadata.bind = engine
 
@@ -1582,7 +1649,7 @@ class DataSource(FieldManagerMixin, PrintMixin):
             dt.to_sql(engine)
             config.setdefault("tables", {})[dt.fullname] = dt.table_config
 
-        reflect_metadata(metadata)
+        reflect_metadata(metadata, reflect_only=list(config.get("tables", {})) or None)
         return cls(ds_name, metadata=metadata, config=config, nlp=nlp)
 
     @classmethod
@@ -1747,7 +1814,10 @@ class AdHocDataTable(PrintMixin):
     def get_dataframe(self):
         """Get the DataFrame representation of the data"""
         if isinstance(self.data, pd.DataFrame):
-            return self.data
+            df = self.data
+            if self.primary_key_columns and df.index.names != self.primary_key_columns:
+                df = df.set_index(self.primary_key_columns)
+            return df
 
         kwargs = self.df_kwargs.copy()
         if self.columns:
@@ -1840,10 +1910,27 @@ class SQLiteDataTable(AdHocDataTable):
 
 
 class CSVDataTable(AdHocDataTable):
-    """AdHocDataTable from a JSON file using pandas.read_csv"""
+    """AdHocDataTable from a CSV file using pandas.read_csv, or pyarrow's
+    multi-threaded CSV reader when it is installed"""
 
     def get_dataframe(self):
         info("Reading CSV from %s" % self.data)
+
+        # The pyarrow reader only handles local files and doesn't support
+        # pandas read_csv kwargs, so fall back to pandas in those cases.
+        if pyarrow_installed and (not self.df_kwargs) and os.path.isfile(self.data):
+            convert_options = None
+            if self.columns:
+                convert_options = pyarrow_csv.ConvertOptions(
+                    include_columns=list(self.columns.keys())
+                )
+            df = pyarrow_csv.read_csv(
+                self.data, convert_options=convert_options
+            ).to_pandas()
+            if self.primary_key_columns:
+                df = df.set_index(self.primary_key_columns)
+            return df
+
         return pd.read_csv(
             self.data,
             index_col=self.primary_key_columns,
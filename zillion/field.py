@@ -1,3 +1,5 @@
+import sys
+
 import sqlalchemy as sa
 
 from zillion.configs import (
@@ -71,6 +73,11 @@ class Field(ConfigMixin, PrintMixin):
     def __init__(
         self, name, type, display_name=None, description=None, meta=None, **kwargs
     ):
+        # Field names get hashed and compared constantly in set operations
+        # across the warehouse; interning lets those short-circuit on identity.
+        # Coerce to str first: sys.intern rejects str subclasses such as
+        # SQLAlchemy's quoted_name, which reflected column names arrive as.
+        self.name = sys.intern(str(name))
         self.sa_type = None
         if isinstance(type, str):
             self.sa_type = type_string_to_sa_type(type)
@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from concurrent.futures import as_completed, ThreadPoolExecutor
 from contextlib import contextmanager
 import decimal
@@ -165,9 +164,9 @@ class DataSourceQuery(ExecutionStateMixin, PrintMixin):
     **Parameters:**
 
     * **warehouse** - (*Warehouse*) A zillion warehouse
-    * **metrics** - (*OrderedDict*) An OrderedDict mapping metric names to
+    * **metrics** - (*dict*) An ordered mapping metric names to
     Metric objects
-    * **dimensions** - (*OrderedDict*) An OrderedDict mapping dimension names to
+    * **dimensions** - (*dict*) An ordered mapping dimension names to
     Dimension objects
     * **criteria** - (*list*) A list of criteria to be applied when querying.
     See the Report docs for more details.
@@ -811,8 +810,8 @@ class BaseCombinedResult:
 
     def _get_fields(self):
         """Returns a 2-item tuple of dimension and metric dicts"""
-        dimensions = OrderedDict()
-        metrics = OrderedDict()
+        dimensions = dict()
+        metrics = dict()
 
         for qr in self.ds_query_results:
             for dim_name, dim in qr.query.dimensions.items():
@@ -945,9 +944,9 @@ class SQLiteMemoryCombinedResult(BaseCombinedResult):
 
         **Parameters:**
 
-        * **metrics** - (*OrderedDict*) An OrderedDict mapping metric names to
+        * **metrics** - (*dict*) An ordered mapping metric names to
         Metric objects
-        * **dimensions** - (*OrderedDict*) An OrderedDict mapping dimension
+        * **dimensions** - (*dict*) An ordered mapping dimension
         names to Dimension objects
         * **row_filters** - (*list*) A list of criteria to filter which rows get
         returned
@@ -1103,7 +1102,7 @@ class SQLiteMemoryCombinedResult(BaseCombinedResult):
     def _select_all(self):
         """Helper to get all rows from the combined result table"""
         qr = self.cursor.execute("SELECT * FROM %s" % self.table_name)
-        return [OrderedDict(row) for row in qr.fetchall()]
+        return [dict(row) for row in qr.fetchall()]
 
     def _get_final_select_sql(self, columns, dimension_aliases, formula_dims):
         """Create the final select SQL statement
@@ -1199,9 +1198,9 @@ class SQLiteMemoryCombinedResult(BaseCombinedResult):
         * **df** - (*DataFrame*) The DataFrame to apply filters to
         * **row_filters** - (*list*) A list of row filter criteria. See the
         Report docs for more details.
-        * **metrics** - (*OrderedDict*) A ordered mapping of metric names to
+        * **metrics** - (*dict*) An ordered mapping of metric names to
         objects
-        * **dimensions** - (*OrderedDict*) A ordered mapping of dimension names
+        * **dimensions** - (*dict*) An ordered mapping of dimension names
         to objects
 
         **Returns:**
@@ -1269,7 +1268,7 @@ class SQLiteMemoryCombinedResult(BaseCombinedResult):
         * **df** - (*DataFrame*) The DataFrame to add a multi-level rollup to
         * **rollup** - (*int or str*) Controls how metrics are rolled up /
         aggregated by dimension. See the Report docs for more details.
-        * **dimensions** - (*OrderedDict*) An ordered mapping of dimension names
+        * **dimensions** - (*dict*) An ordered mapping of dimension names
         to objects
         * **aggrs** - (*dict*) A mapping of aggregations to apply per DataFrame
         column. This will get passed to the pandas `agg` method of each group.
@@ -1333,9 +1332,9 @@ class SQLiteMemoryCombinedResult(BaseCombinedResult):
         * **df** - (*DataFrame*) The dataframe to apply the rollup to
         * **rollup** - (*str or int*) Controls how metrics are rolled up /
         aggregated by dimension. See the Report docs for more details.
-        * **metrics** - (*OrderedDict*) An OrderedDict mapping metric names to
+        * **metrics** - (*dict*) An ordered mapping metric names to
         Metric objects
-        * **dimensions** - (*OrderedDict*) An OrderedDict mapping dimension
+        * **dimensions** - (*dict*) An ordered mapping dimension
         names to Dimension objects
 
         **Returns:**
@@ -1426,9 +1425,9 @@ class SQLiteMemoryCombinedResult(BaseCombinedResult):
         * **row_filters** - (*list*) A list of criteria to filter which rows get
         returned
         * **limit** - (*int*) A limit on the number of rows returned
-        * **metrics** - (*OrderedDict*) An OrderedDict mapping metric names to
+        * **metrics** - (*dict*) An ordered mapping metric names to
         Metric objects
-        * **dimensions** - (*OrderedDict*) An OrderedDict mapping dimension
+        * **dimensions** - (*dict*) An ordered mapping dimension
         names to Dimension objects
 
         **Returns:**
@@ -1616,8 +1615,8 @@ class Report(ExecutionStateMixin):
 
         self.adhoc_datasources = adhoc_datasources or []
 
-        self.ds_metrics = OrderedDict()
-        self.ds_dimensions = OrderedDict()
+        self.ds_metrics = dict()
+        self.ds_dimensions = dict()
 
         for metric in self.metrics.values():
             self._add_ds_fields(metric)
@@ -1710,7 +1709,7 @@ class Report(ExecutionStateMixin):
 
             used_metrics = self.metrics
             if self.is_partial:
-                used_metrics = OrderedDict()
+                used_metrics = dict()
                 for metric_name, metric in self.metrics.items():
                     if metric_name in self.unsupported_grain_metrics:
                         dbg(f"skipping {metric_name} due to unsupported grain")
@@ -1835,7 +1834,7 @@ class Report(ExecutionStateMixin):
         (*dict*) - A mapping of field names to Field objects
 
         """
-        d = OrderedDict()
+        d = dict()
         for name in names or []:
             if field_type == FieldTypes.METRIC:
                 field = self.warehouse.get_metric(name, adhoc_fms=adhoc_datasources)
@@ -2375,8 +2374,8 @@ class ReportResult(PrintMixin):
     * **duration** - (*float*) The report execution duration in seconds
     * **query_summaries** - (*list of DataSourceQuerySummary*) Summaries of the
     underyling query results.
-    * **metrics** - (*OrderedDict*) A mapping of requested metrics to Metric objects
-    * **dimensions** - (*OrderedDict*) A mapping of requested dimensions to Dimension
+    * **metrics** - (*dict*) An ordered mapping of requested metrics to Metric objects
+    * **dimensions** - (*dict*) An ordered mapping of requested dimensions to Dimension
     objects
     * **rollup** - (*str or int*) See the Report docs for more details.
     * **unsupported_grain_metrics** - (*dict*) A dictionary mapping metric names to
@@ -2398,8 +2397,8 @@ class ReportResult(PrintMixin):
         unsupported_grain_metrics=None,
         warnings=None,
     ):
-        raiseif(metrics and (not isinstance(metrics, OrderedDict)))
-        raiseif(dimensions and (not isinstance(dimensions, OrderedDict)))
+        raiseif(metrics and (not isinstance(metrics, dict)))
+        raiseif(dimensions and (not isinstance(dimensions, dict)))
         self.duration = round(duration, 4)
         self.rowcount = len(df)
         self.is_partial = True if unsupported_grain_metrics else False
@@ -1,4 +1,5 @@
 import ast
+import functools
 import os
 import re
 
@@ -69,6 +70,13 @@ SQL_AGGREGATION_FUNCS = set(
     ]
 )
 
+# Fast pre-filter for aggregation checks. If a string doesn't match this it
+# can not contain a call to one of the aggregation functions above, so we can
+# skip the more expensive sqlparse-based analysis entirely.
+AGGREGATION_FUNC_REGEX = re.compile(
+    r"\b(%s)\s*\(" % "|".join(SQL_AGGREGATION_FUNCS), re.IGNORECASE
+)
+
 # This establishes a baseline of schemas to ignore during reflection
 DIALECT_IGNORE_SCHEMAS = {
     "mysql": set(["information_schema", "performance_schema", "mysql", "sys"]),
@@ -107,6 +115,28 @@ def contains_sql_keywords(sql):
     return False
 
 
+def _tokens_contain_aggregation(tokens):
+    """Recursively check sqlparse tokens for aggregation functions"""
+    for token in tokens:
+        if isinstance(token, sp.sql.Function):
+            name = token.get_name()
+            if name.upper() in SQL_AGGREGATION_FUNCS:
+                return True
+        if isinstance(token, sp.sql.TokenList):
+            token_result = _tokens_contain_aggregation(token)
+            if token_result:
+                return True
+    return False
+
+
+@functools.lru_cache(maxsize=2048)
+def _str_contains_aggregation(sql):
+    """Memoized parse-and-check for string input. The same field formulas and
+    column references get checked repeatedly across warehouse builds and
+    report executions, and the result is pure in the input string."""
+    return _tokens_contain_aggregation(sp.parse(sql))
+
+
 def contains_aggregation(sql):
     """Determine whether a SQL query contains aggregation functions.
 
@@ -126,18 +156,10 @@ def contains_aggregation(sql):
 
     """
     if isinstance(sql, str):
-        sql = sp.parse(sql)
-
-    for token in sql:
-        if isinstance(token, sp.sql.Function):
-            name = token.get_name()
-            if name.upper() in SQL_AGGREGATION_FUNCS:
-                return True
-        if isinstance(token, sp.sql.TokenList):
-            token_result = contains_aggregation(token)
-            if token_result:
-                return True
-    return False
+        if not AGGREGATION_FUNC_REGEX.search(sql):
+            return False
+        return _str_contains_aggregation(sql)
+    return _tokens_contain_aggregation(sql)
 
 
 def type_string_to_sa_type(type_string):
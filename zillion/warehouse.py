@@ -1,4 +1,4 @@
-from collections import defaultdict, OrderedDict
+from collections import defaultdict
 import time
 
 import sqlalchemy as sa
@@ -43,7 +43,7 @@ class Warehouse(FieldManagerMixin):
         self.name = None
         self.meta = None
         self.nlp = nlp
-        self._datasources = OrderedDict()
+        self._datasources = dict()
         self._metrics = {}
         self._dimensions = {}
         self._supported_dimension_cache = {}